@@ -0,0 +1,138 @@
+# bench/db_smoke.py
+# End-to-end smoke run of the DB-backed routes against each backend app.py
+# supports: migrate, section PUT/GET (+ETag, paging, filters), stock orders,
+# checkout, the orders log, wishlist toggles, search and stock checks. The
+# PostgreSQL run finishes with copy-db from the SQLite run's file.
+#
+#   python bench/db_smoke.py                                   # SQLite only
+#   python bench/db_smoke.py --postgres postgresql://user@host/foodmart_smoke
+#
+# The PostgreSQL database must be a scratch one: it has to be empty, or
+# --reset drops the app's tables in it first. Each backend runs in its own
+# process because app.py binds DATABASE_URL at import.
+import os, sys, json, argparse, tempfile, subprocess
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+def child(source_db):
+    sys.path.insert(0, os.path.join(HERE, ".."))
+    import app as backend
+    from app import app, db
+
+    failures = []
+
+    def check(cond, what):
+        if not cond:
+            failures.append(what)
+
+    c = app.test_client()
+    with app.app_context():
+        if source_db and backend.sa_inspect(db.engine).get_table_names():
+            print(json.dumps({"backend": db.engine.dialect.name, "failures": ["database not empty (use --reset)"]}))
+            return 1
+        backend.migrate_db()
+        check(backend.schema_version() == backend.SCHEMA_VERSION, "migrate reaches SCHEMA_VERSION")
+
+    cards = [
+        {"id": "smoke-1", "title": "Fresh Mango Juice", "brand": "Real", "price": 5, "qty": 10, "category": "JUICES", "order": 1},
+        {"id": "smoke-2", "title": "Green Apple", "brand": "Farm", "price": 12, "qty": 3, "category": "FRUITS & VEGES", "order": 2},
+        {"id": "smoke-3", "title": "Orange Juice", "brand": "Real", "price": 20, "qty": 0, "category": "JUICES", "order": 3},
+    ]
+    check(c.put("/api/trending", json={"title": "Trending", "cards": cards}).status_code == 200, "PUT /api/trending")
+    cards[0]["price"] = 6  # second save goes through the upsert's update branch
+    check(c.put("/api/trending", json={"title": "Trending", "cards": cards}).status_code == 200, "PUT /api/trending (update)")
+    r = c.get("/api/trending")
+    body = r.get_json()
+    check([x["id"] for x in body["cards"]] == ["smoke-1", "smoke-2", "smoke-3"], "GET /api/trending cards")
+    check(body["cards"][0]["price"] == 6, "upsert updated price")
+    check(c.get("/api/trending", headers={"If-None-Match": r.headers["ETag"]}).status_code == 304, "ETag revalidation")
+
+    page = c.get("/api/trending?limit=2").get_json()
+    check(len(page["cards"]) == 2 and page["nextCursor"], "keyset first page")
+    rest = c.get(f"/api/trending?limit=2&after={page['nextCursor']}").get_json()
+    check([x["id"] for x in rest["cards"]] == ["smoke-3"], "keyset second page")
+    f = c.get("/api/trending?category=JUICES&minPrice=1").get_json()
+    check({x["id"] for x in f["cards"]} == {"smoke-1", "smoke-3"}, "category filter")
+    check(f["facets"]["category"] == {"JUICES": 2, "FRUITS & VEGES": 1}, "category facets")
+
+    check(c.post("/api/trending/order", json={"id": "smoke-1", "qty": 4}).get_json().get("qty") == 6, "order decrements stock")
+    check(c.post("/api/trending/order", json={"id": "smoke-3", "qty": 1}).status_code == 400, "order refuses empty stock")
+    ok = c.post("/api/checkout", json={"lines": [{"productId": "smoke-1", "qty": 1}, {"productId": "smoke-2", "qty": 1}]})
+    check(ok.status_code == 200, "checkout succeeds")
+    bad = c.post("/api/checkout", json={"lines": [{"productId": "smoke-1", "qty": 1}, {"productId": "smoke-2", "qty": 99}]})
+    check(bad.status_code == 409, "checkout rejects oversell")
+    stock = c.post("/api/stock/check", json={"lines": [{"id": "smoke-1", "qty": 1}, {"id": "smoke-2", "qty": 1}]}).get_json()
+    check([x["stock"] for x in stock["lines"]] == [5, 2], "checkout rollback left stock untouched")
+
+    check(c.post("/api/orders", json={"productId": "smoke-2", "price": 12, "qty": 1}).status_code == 201, "POST /api/orders")
+    orders = c.get("/api/orders?limit=1").get_json()
+    check(len(orders["items"]) == 1 and orders["nextCursor"], "GET /api/orders first page")
+    more = c.get(f"/api/orders?limit=50&after={orders['nextCursor']}").get_json()
+    check(len(more["items"]) >= 2, "GET /api/orders next page")
+
+    h = {"X-User-Id": "smoke"}
+    check(c.post("/api/wishlist/toggle", json={"id": "smoke-1"}, headers=h).get_json().get("added"), "wishlist add")
+    check(c.get("/api/wishlist/ids", headers=h).get_json()["ids"] == ["smoke-1"], "wishlist ids")
+    check(c.post("/api/wishlist/toggle", json={"id": "smoke-1"}, headers=h).get_json().get("removed"), "wishlist remove")
+    check(c.get("/api/wishlist/ids", headers=h).get_json()["ids"] == [], "wishlist ids after remove")
+
+    s = c.get("/api/search?q=real mang").get_json()
+    check([x["id"] for x in s["results"]] == ["smoke-1"], f"search ({s.get('engine')})")
+    check(c.get("/api/home").status_code == 200, "GET /api/home")
+
+    if source_db:
+        res = app.test_cli_runner().invoke(args=["copy-db", "--source", source_db, "--replace"])
+        check(res.exit_code == 0, "copy-db: " + res.output.strip().splitlines()[-1] if res.output.strip() else "copy-db")
+        copied = c.get("/api/trending").get_json()
+        check([x["id"] for x in copied["cards"]] == ["smoke-1", "smoke-2", "smoke-3"], "copy-db carried the trending rows")
+        # serial ids were copied explicitly; new rows must not collide with them
+        check(c.post("/api/wishlist/toggle", json={"id": "smoke-2"}, headers=h).status_code == 200, "insert after copy-db")
+
+    with app.app_context():
+        dialect = db.engine.dialect.name
+    print(json.dumps({"backend": dialect, "failures": failures}))
+    return 1 if failures else 0
+
+def reset_postgres(url):
+    env = {**os.environ, "DATABASE_URL": url, "PAYLOAD_CACHE_DIR": tempfile.mkdtemp(prefix="foodmart-smoke-")}
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from app import app, db\n"
+        "with app.app_context():\n"
+        "    db.drop_all()\n" % os.path.join(HERE, "..")
+    )
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+def run(url, source_db=None):
+    env = {**os.environ, "DATABASE_URL": url, "PAYLOAD_CACHE_DIR": tempfile.mkdtemp(prefix="foodmart-smoke-")}
+    args = [sys.executable, __file__, "--child"] + (["--source-db", source_db] if source_db else [])
+    p = subprocess.run(args, env=env, capture_output=True, text=True)
+    try:
+        report = json.loads(p.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        report = {"backend": url.split(":", 1)[0], "failures": ["crashed"], "stderr": p.stderr[-4000:]}
+    return report
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--postgres", default=os.environ.get("DB_SMOKE_POSTGRES_URL", ""), help="scratch PostgreSQL URL")
+    ap.add_argument("--reset", action="store_true", help="drop the app's tables in the PostgreSQL database first")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--source-db", default="", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        sys.exit(child(args.source_db))
+
+    sqlite_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="foodmart-smoke-"), "smoke.db")
+    reports = [run(sqlite_url)]
+    if args.postgres:
+        if args.reset:
+            reset_postgres(args.postgres)
+        reports.append(run(args.postgres, source_db=sqlite_url))
+    else:
+        reports.append({"backend": "postgresql", "skipped": "pass --postgres or set DB_SMOKE_POSTGRES_URL"})
+    print(json.dumps(reports, indent=2))
+    sys.exit(1 if any(r.get("failures") for r in reports) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+# bench/loadtest.py
+# Seeds a synthetic catalog into a scratch DB (and scratch JSON/upload dirs),
+# serves app.py and trending.py on threaded local servers and drives every
+# GET/PUT/order/wishlist/upload route with concurrent keep-alive clients.
+# Each endpoint is run on its own, then all of them as one weighted mix;
+# p50/p95/p99 latency (of 2xx responses only; every status is counted) and
+# throughput are printed as JSON.
+#
+# A section PUT replaces the whole section with --cap cards, so the PUT
+# endpoints run last in the per-endpoint phase, the catalog is re-seeded
+# before the mix and the mix leaves them out.
+#
+#   python bench/loadtest.py --products 20000 --requests 500 --workers 16
+#   python bench/loadtest.py --only search,home --out before.json
+#
+# Runs are reproducible for a given --seed: catalog, request order and
+# request bodies all come from it. Compare two JSON reports run to run on the
+# same box; absolute numbers between machines mean little.
+import os, io, sys, json, time, random, logging, argparse, platform, tempfile, threading, http.client
+from concurrent.futures import ThreadPoolExecutor
+
+SCRATCH = tempfile.mkdtemp(prefix="foodmart-load-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(SCRATCH, "bench.db")
+os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(SCRATCH, "cache")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from werkzeug.serving import make_server
+import app as backend
+import trending
+from app import app
+
+try:  # distinct images exercise the full upload path; without Pillow every upload dedupes
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# 1x1 PNG
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+WORDS = ["organic", "fresh", "apple", "banana", "mango", "tomato", "juice", "milk", "bread",
+         "cheese", "butter", "rice", "honey", "green", "tea", "coffee", "spinach", "orange"]
+BRANDS = ["Amul", "Tropicana", "Real", "Britannia", "Tata", "Nestle", "Dabur", "Mother Dairy"]
+CATEGORIES = ["FRUITS & VEGES", "JUICES", "DAIRY", "BAKERY"]
+SECTIONS = ("popular", "just", "trending", "best")
+
+def card(rng, pid, i):
+    name = " ".join(rng.sample(WORDS, 3))
+    return {
+        "id": pid, "title": name.title(), "brand": rng.choice(BRANDS),
+        "desc": " ".join(rng.choice(WORDS) for _ in range(12)),
+        "img": "", "unit": "1 UNIT", "price": round(rng.uniform(1, 60), 2),
+        "rating": round(rng.uniform(3, 5), 1), "discount": rng.randrange(0, 40),
+        "order": i + 1, "qty": 10 ** 9, "category": rng.choice(CATEGORIES),
+    }
+
+def seed(n, cap, rng):
+    """Fill every section with n // 4 products; returns {section: [ids]}."""
+    per = max(1, n // len(SECTIONS))
+    catalog = {sec: [card(rng, f"{sec}-{i}", i) for i in range(per)] for sec in SECTIONS}
+    with app.app_context():
+        backend.migrate_db()
+        backend.CAP = max(per, cap)  # saves truncate to CAP; lift it while seeding
+        backend.save_section("POPULAR", "Most popular products", {"title": "Popular", "cards": catalog["popular"]})
+        backend.save_section("JUST", "Just arrived", {"title": "Just arrived", "cards": catalog["just"]})
+        backend.save_trending_db({"title": "Trending", "cards": catalog["trending"]})
+        backend.save_best_db({"title": "Best selling", "cards": catalog["best"]})
+        backend.save_new_arrived_db({"title": "New", "cards": [
+            {"id": f"brand-{i}", "title": b, "img": ""} for i, b in enumerate(BRANDS)
+        ]})
+        backend.save_blogs_db({"title": "Blog", "cards": [
+            {"id": f"post-{i}", "title": f"Post {i}", "excerpt": "lorem ipsum"} for i in range(3)
+        ]})
+        backend.CAP = cap
+    trending.products_store.write({"title": "Trending Products", "categories": ["ALL"] + CATEGORIES,
+                                   "items": catalog["trending"][: cap * 10]})
+    trending.new_arrivals_store.write({"title": "Newly Arrived", "categories": ["ALL"],
+                                       "items": [{"id": f"na-{i}", "title": b} for i, b in enumerate(BRANDS)]})
+    ids = {sec: [c["id"] for c in cards] for sec, cards in catalog.items()}
+    ids["products"] = ids["trending"][: cap * 10]
+    return ids
+
+def png(rng):
+    if Image is None:
+        return TINY_PNG
+    buf = io.BytesIO()
+    Image.new("RGB", (64, 64), tuple(rng.randrange(256) for _ in range(3))).save(buf, "PNG")
+    return buf.getvalue()
+
+def multipart(field, filename, data, ctype):
+    boundary = "loadtest" + os.urandom(8).hex()
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"{field}\"; filename=\"{filename}\"\r\n"
+        f"Content-Type: {ctype}\r\n\r\n"
+    ).encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+def scenarios(ids, cap, upload_name):
+    """name -> (server, weight in the mix, fn(rng, user) -> (method, path, body, headers))."""
+    js = lambda method, path, payload, **hdrs: (method, path, json.dumps(payload).encode(), {"Content-Type": "application/json", **hdrs})
+    get = lambda path: ("GET", path, None, {})
+    pick = lambda rng, sec: rng.choice(ids[sec])
+    put_cards = lambda rng, sec: [card(rng, pid, i) for i, pid in enumerate(ids[sec][:cap])]
+    return {
+        "home": ("api", 10, lambda rng, u: get("/api/home")),
+        "home_gzip": ("api", 5, lambda rng, u: ("GET", "/api/home", None, {"Accept-Encoding": "gzip"})),
+        "popular": ("api", 4, lambda rng, u: get("/api/popular")),
+        "just_arrived": ("api", 4, lambda rng, u: get("/api/just-arrived")),
+        "trending": ("api", 4, lambda rng, u: get("/api/trending")),
+        "trending_filtered": ("api", 4, lambda rng, u: get(
+            f"/api/trending?category={rng.choice(CATEGORIES).replace(' ', '%20').replace('&', '%26')}&minRating=4&limit=20")),
+        "trending_page": ("api", 2, lambda rng, u: get("/api/trending?limit=50")),
+        "best_selling": ("api", 4, lambda rng, u: get("/api/best-selling")),
+        "new_arrived": ("api", 2, lambda rng, u: get("/api/new-arrived")),
+        "blogs": ("api", 2, lambda rng, u: get("/api/blogs")),
+        "search": ("api", 6, lambda rng, u: get(f"/api/search?q={rng.choice(WORDS)}%20{rng.choice(WORDS)[:3]}")),
+        "orders_list": ("api", 1, lambda rng, u: get("/api/orders?limit=20")),
+        "wishlist": ("api", 2, lambda rng, u: ("GET", "/api/wishlist", None, {"X-User-Id": u})),
+        "wishlist_ids": ("api", 6, lambda rng, u: ("GET", "/api/wishlist/ids", None, {"X-User-Id": u})),
+        "wishlist_toggle": ("api", 3, lambda rng, u: js("POST", "/api/wishlist/toggle", {
+            "id": pick(rng, rng.choice(SECTIONS)), "title": "x", "price": 1}, **{"X-User-Id": u})),
+        "trending_order": ("api", 2, lambda rng, u: js("POST", "/api/trending/order", {"id": pick(rng, "trending"), "qty": 1})),
+        "best_order": ("api", 2, lambda rng, u: js("POST", "/api/best-selling/order", {"id": pick(rng, "best"), "qty": 1})),
+        "stock_order": ("api", 2, lambda rng, u: js("POST", "/api/stock/order", {"id": pick(rng, "popular"), "qty": 1})),
+        "stock_check": ("api", 2, lambda rng, u: js("POST", "/api/stock/check", {
+            "lines": [{"id": pick(rng, rng.choice(SECTIONS)), "qty": 1} for _ in range(20)]})),
+        "checkout": ("api", 1, lambda rng, u: js("POST", "/api/checkout", {
+            "lines": [{"productId": pick(rng, rng.choice(SECTIONS)), "qty": 1} for _ in range(5)]})),
+        "orders_post": ("api", 1, lambda rng, u: js("POST", "/api/orders", {
+            "productId": pick(rng, "trending"), "title": "x", "price": 5, "qty": 1})),
+        "put_popular": ("api", 1, lambda rng, u: js("PUT", "/api/popular", {"title": "Popular", "cards": put_cards(rng, "popular")})),
+        "put_trending": ("api", 1, lambda rng, u: js("PUT", "/api/trending", {"title": "Trending", "cards": put_cards(rng, "trending")})),
+        "put_best_selling": ("api", 1, lambda rng, u: js("PUT", "/api/best-selling", {"title": "Best selling", "cards": put_cards(rng, "best")})),
+        "upload_image": ("api", 1, lambda rng, u: ("POST", "/api/upload-image", *multipart("image", "x.png", png(rng), "image/png"))),
+        "upload_serve": ("api", 4, lambda rng, u: get("/uploads/" + upload_name)),
+        "products": ("trending", 3, lambda rng, u: get("/api/products")),
+        "products_filtered": ("trending", 2, lambda rng, u: get("/api/products?category=JUICES&minPrice=10")),
+        "new_arrivals_json": ("trending", 2, lambda rng, u: get("/api/new-arrivals")),
+        "product_patch": ("trending", 1, lambda rng, u: js("PATCH", f"/api/products/items/{pick(rng, 'products')}",
+                                                          {"qty": rng.randrange(1, 100)})),
+    }
+
+def serve(wsgi):
+    srv = make_server("127.0.0.1", 0, wsgi, threaded=True)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+def percentile(sorted_vals, p):
+    if not sorted_vals:
+        return None
+    k = min(len(sorted_vals) - 1, max(0, int(round(p / 100 * len(sorted_vals))) - 1))
+    return round(sorted_vals[k] * 1000, 2)
+
+def drive(ports, plan, cases, workers, seed):
+    """Run plan (a list of scenario names) across workers; returns per-name stats."""
+    local = threading.local()
+    lock = threading.Lock()
+    lat, codes = {}, {}
+
+    def one(i):
+        name = plan[i]
+        server, _, build = cases[name]
+        rng = random.Random(seed * 1_000_003 + i)
+        method, path, body, headers = build(rng, f"load-{i % 64}")
+        conns = getattr(local, "conns", None)
+        if conns is None:
+            conns = local.conns = {}
+        conn = conns.get(server)
+        if conn is None:
+            conn = conns[server] = http.client.HTTPConnection("127.0.0.1", ports[server], timeout=60)
+        t0 = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            r = conn.getresponse()
+            r.read()
+            status = r.status
+            if r.getheader("Connection", "").lower() == "close":
+                conn.close()
+                conns.pop(server, None)
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conns.pop(server, None)
+            status = "error"
+        dt = time.perf_counter() - t0
+        with lock:
+            # a fast 503/4xx would drag the percentiles down: time successes only
+            vals = lat.setdefault(name, [])
+            if isinstance(status, int) and 200 <= status < 300:
+                vals.append(dt)
+            c = codes.setdefault(name, {})
+            c[str(status)] = c.get(str(status), 0) + 1
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(one, range(len(plan))))
+    elapsed = time.perf_counter() - t0
+
+    out = {}
+    for name, vals in lat.items():
+        vals.sort()
+        out[name] = {
+            "requests": sum(codes[name].values()),
+            "status": codes[name],
+            "timed": len(vals),
+            "p50Ms": percentile(vals, 50),
+            "p95Ms": percentile(vals, 95),
+            "p99Ms": percentile(vals, 99),
+            "maxMs": round(vals[-1] * 1000, 2) if vals else None,
+        }
+    return out, elapsed
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--products", type=int, default=2000, help="catalog size, split across the four stock sections")
+    ap.add_argument("--cap", type=int, default=10, help="cards per section payload (SECTION_CAP)")
+    ap.add_argument("--requests", type=int, default=300, help="requests per endpoint")
+    ap.add_argument("--mix", type=int, default=3000, help="requests in the weighted mixed phase (0 to skip)")
+    ap.add_argument("--workers", type=int, default=16)
+    ap.add_argument("--warmup", type=int, default=20, help="unrecorded requests per endpoint first")
+    ap.add_argument("--only", default="", help="comma-separated endpoint names")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--out", default="", help="also write the report here")
+    args = ap.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    backend.UPLOAD_DIR = os.path.join(SCRATCH, "uploads")
+    os.makedirs(backend.UPLOAD_DIR, exist_ok=True)
+    # uploads past UPLOAD_CONCURRENCY are refused with 503 at once; give every
+    # client a slot so upload_image times encodes, not rejections
+    backend._upload_slots = threading.BoundedSemaphore(max(args.workers, int(os.environ.get("UPLOAD_CONCURRENCY", "2"))))
+    for store, name in ((trending.products_store, "products.json"), (trending.new_arrivals_store, "new_arrivals.json")):
+        store.path = os.path.join(SCRATCH, name)
+
+    rng = random.Random(args.seed)
+    t0 = time.perf_counter()
+    ids = seed(args.products, args.cap, rng)
+    seeded = time.perf_counter() - t0
+
+    servers = {"api": serve(app), "trending": serve(trending.app)}
+    ports = {k: srv.server_port for k, srv in servers.items()}
+
+    # one stored upload for the serving scenario
+    body, headers = multipart("image", "seed.png", png(rng), "image/png")
+    conn = http.client.HTTPConnection("127.0.0.1", ports["api"])
+    conn.request("POST", "/api/upload-image", body=body, headers=headers)
+    upload_name = json.loads(conn.getresponse().read())["url"].rsplit("/", 1)[-1]
+    conn.close()
+
+    cases = scenarios(ids, args.cap, upload_name)
+    names = [n for n in cases if not args.only or n in args.only.split(",")]
+    names.sort(key=lambda n: n.startswith("put_"))  # stable: writes that shrink sections go last
+    if not names:
+        sys.exit("no endpoints match --only; choose from: " + ", ".join(cases))
+
+    report = {
+        "scratch": SCRATCH,
+        "args": vars(args),
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "seedSeconds": round(seeded, 2),
+        "endpoints": {},
+    }
+    for name in names:
+        drive(ports, [name] * args.warmup, cases, args.workers, args.seed + 7)
+        stats, elapsed = drive(ports, [name] * args.requests, cases, args.workers, args.seed)
+        report["endpoints"][name] = {**stats[name], "requestsPerSec": round(args.requests / elapsed, 1)}
+
+    mixed = [n for n in names if not n.startswith("put_")]
+    if args.mix and mixed:
+        if len(mixed) < len(names):
+            seed(args.products, args.cap, random.Random(args.seed))
+        mrng = random.Random(args.seed)
+        plan = mrng.choices(mixed, weights=[cases[n][1] for n in mixed], k=args.mix)
+        stats, elapsed = drive(ports, plan, cases, args.workers, args.seed + 13)
+        report["mixed"] = {"requests": args.mix, "requestsPerSec": round(args.mix / elapsed, 1), "endpoints": stats}
+
+    for srv in servers.values():
+        srv.shutdown()
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+if __name__ == "__main__":
+    main()
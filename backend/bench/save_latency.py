@@ -0,0 +1,70 @@
+# bench/save_latency.py
+# Times save_trending_db / save_section against card count on a scratch DB:
+# a cold save (all inserts), a warm save (all updates) and a reshuffle that
+# replaces half the cards (updates + inserts + delete).
+#
+#   python bench/save_latency.py --counts 10,100,1000,5000 --repeat 3
+import os, sys, json, time, argparse, tempfile
+
+SCRATCH = tempfile.mkdtemp(prefix="foodmart-save-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(SCRATCH, "bench.db")
+os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(SCRATCH, "cache")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app as backend
+from app import app, db, TrendingItem, SectionItem
+
+def cards(n, prefix):
+    return [
+        {"id": f"{prefix}-{i}", "title": f"Product {i}", "brand": "Bench", "price": 1 + i % 50,
+         "rating": 4.5, "discount": i % 20, "qty": 100, "order": i + 1, "category": "JUICES"}
+        for i in range(n)
+    ]
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+def bench(n, repeat):
+    out = {}
+    targets = {
+        "trending": (lambda body: backend.save_trending_db(body), TrendingItem),
+        "section": (lambda body: backend.save_section("POPULAR", "Most popular products", body), SectionItem),
+    }
+    for name, (save, model) in targets.items():
+        cold, warm, mixed = [], [], []
+        for _ in range(repeat):
+            model.query.delete()
+            db.session.commit()
+            first = cards(n, "a")
+            cold.append(timed(lambda: save({"title": "Bench", "cards": first})))
+            warm.append(timed(lambda: save({"title": "Bench", "cards": first})))
+            half = first[: n // 2] + cards(n - n // 2, "b")
+            mixed.append(timed(lambda: save({"title": "Bench", "cards": half})))
+        out[name] = {
+            "coldMs": round(min(cold), 2),
+            "warmMs": round(min(warm), 2),
+            "mixedMs": round(min(mixed), 2),
+            "usPerCard": round(min(warm) * 1000 / max(n, 1), 1),
+        }
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--counts", default="10,100,1000,5000")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    counts = [int(x) for x in args.counts.split(",") if x]
+
+    # the saves truncate to CAP; lift it so large catalogs are actually written
+    backend.CAP = max(counts)
+    report = {"scratch": SCRATCH, "results": {}}
+    with app.app_context():
+        backend.migrate_db()
+        for n in counts:
+            report["results"][str(n)] = bench(n, args.repeat)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# bench/search_latency.py
+# Times GET /api/search on a scratch DB holding a synthetic catalog (default
+# 100k products): the type-ahead keystrokes of a few queries, from common
+# words that match most of the catalog down to rare ones.
+#
+#   python bench/search_latency.py --products 100000 --repeat 20
+import os, sys, json, time, random, argparse, tempfile
+
+SCRATCH = tempfile.mkdtemp(prefix="foodmart-search-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(SCRATCH, "bench.db")
+os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(SCRATCH, "cache")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app as backend
+from app import app, db
+
+# a few words most products share, the rest drawn from a long tail
+COMMON = ["fresh", "organic", "juice", "real", "pack"]
+BRANDS = ["Real", "Farm", "Sunstar", "Amul", "Tropicana", "Nestle", "Dabur", "Britannia"]
+QUERIES = ["f", "fr", "fre", "fresh", "real", "real ma", "real mang", "orange ju", "zz", "xq"]
+
+def catalog(n, seed=7):
+    rnd = random.Random(seed)
+    tail = ["".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(4, 9))) for _ in range(5000)]
+    tail += ["mango", "orange", "apple", "lemon", "banana", "guava"]
+    cards = []
+    for i in range(n):
+        words = rnd.sample(COMMON, rnd.randint(1, 3)) + rnd.sample(tail, 2)
+        rnd.shuffle(words)
+        cards.append({
+            "id": f"p{i}", "title": " ".join(words).title(), "brand": rnd.choice(BRANDS),
+            "desc": " ".join(rnd.sample(tail, 6)), "price": 1 + i % 50, "qty": 10, "order": i + 1,
+        })
+    return cards
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--products", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    # the saves truncate to CAP; lift it so the whole catalog is written
+    backend.CAP = args.products
+    with app.app_context():
+        backend.migrate_db()
+        t0 = time.perf_counter()
+        backend.save_trending_db({"title": "Bench", "cards": catalog(args.products)})
+        load_s = time.perf_counter() - t0
+        db.session.execute(db.text(f"INSERT INTO {backend.SEARCH_TABLE}({backend.SEARCH_TABLE}) VALUES ('optimize')"))
+        db.session.commit()
+
+    c = app.test_client()
+    results = {}
+    for q in QUERIES:
+        body = c.get("/api/search", query_string={"q": q}).get_json()  # warm
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            c.get("/api/search", query_string={"q": q})
+            times.append((time.perf_counter() - t0) * 1000)
+        times.sort()
+        results[q] = {"hits": len(body["results"]), "p50Ms": round(times[len(times) // 2], 2), "maxMs": round(times[-1], 2)}
+    print(json.dumps({"scratch": SCRATCH, "products": args.products, "engine": body.get("engine"),
+                      "loadSeconds": round(load_s, 1), "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
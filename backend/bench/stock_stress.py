@@ -0,0 +1,81 @@
+# bench/stock_stress.py
+# Fires concurrent orders at one trending and one best-selling product with a
+# fixed starting stock, then checks that nothing was oversold or lost:
+#   final stock + units sold == starting stock
+#
+#   python bench/stock_stress.py --orders 5000 --workers 32 --stock 1000
+import os, sys, json, time, random, argparse, tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+SCRATCH = tempfile.mkdtemp(prefix="foodmart-stock-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(SCRATCH, "bench.db")
+os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(SCRATCH, "cache")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app import app, db, TrendingItem, BestSellingItem, ensure_trending_section, ensure_best_section
+
+ROUTES = {
+    "trending": ("/api/trending/order", TrendingItem),
+    "best": ("/api/best-selling/order", BestSellingItem),
+}
+
+def seed(stock):
+    with app.app_context():
+        db.create_all()
+        t = ensure_trending_section()
+        b = ensure_best_section()
+        db.session.add(TrendingItem(id="stress-trending", section_id=t.id, title="Stress", qty=stock))
+        db.session.add(BestSellingItem(id="stress-best", section_id=b.id, title="Stress", qty=stock, orders=0))
+        db.session.commit()
+
+def run(kind, orders, workers, max_units):
+    url, _ = ROUTES[kind]
+    pid = "stress-" + kind
+    client = app.test_client()
+    rng = random.Random(42)
+    units = [rng.randint(1, max_units) for _ in range(orders)]
+
+    def place(n):
+        r = client.post(url, json={"id": pid, "qty": n})
+        return r.status_code, n
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(place, units))
+    elapsed = time.perf_counter() - t0
+
+    sold = sum(n for code, n in results if code == 200)
+    codes = {}
+    for code, _ in results:
+        codes[str(code)] = codes.get(str(code), 0) + 1
+    return {"sold": sold, "status": codes, "seconds": round(elapsed, 3), "ordersPerSec": round(orders / elapsed, 1)}
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--orders", type=int, default=2000)
+    ap.add_argument("--workers", type=int, default=32)
+    ap.add_argument("--stock", type=int, default=1000)
+    ap.add_argument("--max-units", type=int, default=3)
+    args = ap.parse_args()
+
+    seed(args.stock)
+    report, ok = {"scratch": SCRATCH, "orders": args.orders, "workers": args.workers, "startStock": args.stock}, True
+    for kind, (_, model) in ROUTES.items():
+        out = run(kind, args.orders, args.workers, args.max_units)
+        with app.app_context():
+            item = db.session.get(model, "stress-" + kind)
+            out["finalStock"] = item.qty
+            if kind == "best":
+                out["ordersCounter"] = item.orders
+        out["consistent"] = (
+            out["finalStock"] >= 0
+            and out["finalStock"] + out["sold"] == args.stock
+            and out.get("ordersCounter", out["sold"]) == out["sold"]
+        )
+        ok = ok and out["consistent"]
+        report[kind] = out
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
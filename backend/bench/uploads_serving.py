@@ -0,0 +1,82 @@
+# bench/uploads_serving.py
+# Requests/sec for /uploads/<file>: the old Flask route (send_from_directory
+# inside a view) against the UploadServer WSGI layer now in front of app.py.
+# Both run on a threaded werkzeug server on localhost and are hit over HTTP.
+#
+#   python bench/uploads_serving.py --requests 3000 --workers 16
+import os, sys, json, time, logging, argparse, tempfile, threading, http.client
+from concurrent.futures import ThreadPoolExecutor
+
+SCRATCH = tempfile.mkdtemp(prefix="foodmart-uploads-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(SCRATCH, "bench.db")
+os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(SCRATCH, "cache")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from flask import Flask, send_from_directory
+from werkzeug.serving import make_server
+from app import app, UPLOAD_DIR
+
+def legacy_app():
+    old = Flask("legacy_uploads")
+
+    @old.get("/uploads/<path:filename>")
+    def serve_upload(filename):
+        return send_from_directory(UPLOAD_DIR, filename, as_attachment=False)
+
+    return old
+
+def serve(wsgi):
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    srv = make_server("127.0.0.1", 0, wsgi, threaded=True)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+def hammer(port, names, total, workers):
+    local = threading.local()
+    lat = []
+
+    def one(i):
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection("127.0.0.1", port)
+        t0 = time.perf_counter()
+        conn.request("GET", "/uploads/" + names[i % len(names)])
+        r = conn.getresponse()
+        r.read()
+        lat.append(time.perf_counter() - t0)
+        if r.getheader("Connection", "").lower() == "close":
+            conn.close()
+            local.conn = None
+        return r.status
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        codes = list(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - t0
+    lat.sort()
+    return {
+        "requestsPerSec": round(total / elapsed, 1),
+        "p50Ms": round(lat[len(lat) // 2] * 1000, 2),
+        "p99Ms": round(lat[int(len(lat) * 0.99) - 1] * 1000, 2),
+        "non200": sum(1 for c in codes if c != 200),
+    }
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=3000)
+    ap.add_argument("--workers", type=int, default=16)
+    args = ap.parse_args()
+
+    names = sorted(n for n in os.listdir(UPLOAD_DIR) if os.path.isfile(os.path.join(UPLOAD_DIR, n)))[:20]
+    if not names:
+        sys.exit("no files in " + UPLOAD_DIR)
+    report = {"files": len(names), "requests": args.requests, "workers": args.workers}
+    for label, wsgi in (("legacyRoute", legacy_app()), ("uploadServer", app)):
+        srv = serve(wsgi)
+        hammer(srv.server_port, names, min(200, args.requests), args.workers)  # warm-up
+        report[label] = hammer(srv.server_port, names, args.requests, args.workers)
+        srv.shutdown()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
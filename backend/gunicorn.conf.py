@@ -0,0 +1,30 @@
+# gunicorn.conf.py
+# Multi-worker config for wsgi.py; every knob can be overridden from the env.
+#   WEB_CONCURRENCY   worker processes        (default: 2 * CPUs + 1)
+#   GUNICORN_THREADS  threads per worker      (default: 4, gthread worker)
+#   GUNICORN_KEEPALIVE seconds to hold idle keep-alive connections (default: 5)
+import os, multiprocessing
+
+wsgi_app = os.environ.get("WSGI_APP", "wsgi:create_app()")
+bind = os.environ.get("BIND", "127.0.0.1:5000")
+
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+worker_class = "gthread" if threads > 1 else "sync"
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+backlog = int(os.environ.get("GUNICORN_BACKLOG", "2048"))
+
+# recycle workers now and then so slow leaks (Pillow buffers etc.) stay bounded
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+
+# load (and bootstrap) the app once in the master; workers fork from it
+preload_app = True
+# heartbeat files on tmpfs so a busy disk can't stall workers
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG") or None
+errorlog = os.environ.get("GUNICORN_ERROR_LOG", "-")
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
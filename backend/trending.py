@@ -1,9 +1,15 @@
 # app.py
-import os, json, uuid
+import os, json, uuid, hashlib, threading
+from contextlib import contextmanager
 from datetime import datetime
 from flask import Flask, request, jsonify, send_from_directory, make_response
 from werkzeug.utils import secure_filename
 
+try:  # cross-process write lock; threads are still serialised without it
+    import fcntl
+except ImportError:
+    fcntl = None
+
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
@@ -28,20 +34,158 @@ def read_json(path: str) -> dict:
         return json.load(f)
 
 def write_json(path: str, data: dict):
-    with open(path, "w", encoding="utf-8") as f:
+    # temp file + rename: readers see the old file or the new one, never half
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def file_stamp(path: str):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+class JsonStore:
+    # Parsed copy of one JSON file plus its serialized response body. GETs
+    # only stat the file; it is re-read when another process replaced it.
+    def __init__(self, path: str, defaults: dict):
+        self.path = path
+        self.defaults = defaults
+        self._mutex = threading.Lock()
+        self._snap = None  # (stamp, data, body, etag, index id -> position)
+
+    def _load(self, data: dict, stamp):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        items = data.get("items") if isinstance(data.get("items"), list) else []
+        index = {str(it.get("id")): i for i, it in enumerate(items) if isinstance(it, dict) and it.get("id") is not None}
+        self._snap = (stamp, data, body, etag, index)
+        return self._snap
+
+    def snapshot(self):
+        stamp = file_stamp(self.path)
+        snap = self._snap
+        if snap is not None and snap[0] == stamp:
+            return snap
+        with self._mutex:
+            ensure_file(self.path, self.defaults)
+            stamp = file_stamp(self.path)
+            return self._load(read_json(self.path) or {}, stamp)
+
+    @contextmanager
+    def locked(self):
+        with self._mutex:
+            if fcntl is None:
+                yield
+                return
+            with open(self.path + ".lock", "a") as lf:
+                fcntl.flock(lf, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def write(self, data: dict):
+        with self.locked():
+            write_json(self.path, data)
+            self._load(data, file_stamp(self.path))
+
+    def patch_item(self, item_id: str, fields: dict):
+        with self.locked():
+            stamp = file_stamp(self.path)
+            snap = self._snap if self._snap is not None and self._snap[0] == stamp else None
+            if snap is None:
+                ensure_file(self.path, self.defaults)
+                snap = self._load(read_json(self.path) or {}, file_stamp(self.path))
+            _, data, _, _, index = snap
+            pos = index.get(str(item_id))
+            if pos is None:
+                return None
+            items = list(data["items"])
+            items[pos] = {**items[pos], **fields, "id": items[pos].get("id")}
+            data = {**data, "items": items}
+            write_json(self.path, data)
+            self._load(data, file_stamp(self.path))
+            return items[pos]
+
+def store_response(store: JsonStore):
+    _, _, body, etag, _ = store.snapshot()
+    resp = make_response(body, 200)
+    resp.mimetype = "application/json"
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+FILTER_ARGS = ("category", "minPrice", "maxPrice", "minRating", "minDiscount")
+
+def arg_num(name: str):
+    v = request.args.get(name)
+    try:
+        return float(v) if v not in (None, "") else None
+    except ValueError:
+        return None
+
+def item_num(it: dict, key: str) -> float:
+    try:
+        return float(it.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def filtered_response(store: JsonStore):
+    # same filters as app.py's section endpoints, applied to the in-memory
+    # snapshot; facets count categories under the range filters only
+    _, data, _, etag, _ = store.snapshot()
+    lo, hi = arg_num("minPrice"), arg_num("maxPrice")
+    rating, disc = arg_num("minRating"), arg_num("minDiscount")
+    cat = (request.args.get("category") or "").strip()
+    cat = cat if cat and cat.upper() != "ALL" else None
+    items, facets = [], {}
+    for it in data.get("items") if isinstance(data.get("items"), list) else []:
+        if not isinstance(it, dict):
+            continue
+        price = item_num(it, "price")
+        if (lo is not None and price < lo) or (hi is not None and price > hi) \
+                or (rating is not None and item_num(it, "rating") < rating) \
+                or (disc is not None and item_num(it, "discount") < disc):
+            continue
+        c = str(it.get("category") or "")
+        facets[c] = facets.get(c, 0) + 1
+        if cat is None or c == cat:
+            items.append(it)
+    resp = make_response(jsonify({**data, "items": items, "facets": {"category": facets}}), 200)
+    resp.set_etag(etag + "-" + hashlib.blake2b(request.query_string, digest_size=8).hexdigest())
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+def patch_item_response(store: JsonStore, item_id: str):
+    fields = request.get_json(silent=True)
+    if not isinstance(fields, dict):
+        resp = make_response(jsonify({"error": "JSON object of fields required"}), 400)
+    else:
+        item = store.patch_item(item_id, fields)
+        resp = make_response(jsonify({"ok": True, "item": item}) if item else jsonify({"error": "Not found"}), 200 if item else 404)
+    resp.headers["Cache-Control"] = "no-store"
+    return resp
+
+products_store = JsonStore(
+    PRODUCTS_JSON,
+    {"title": "Trending Products", "categories": ["ALL", "FRUITS & VEGES", "JUICES"], "items": []},
+)
+new_arrivals_store = JsonStore(
+    NEW_ARRIVALS_JSON,
+    {"title": "Newly Arrived", "categories": ["ALL", "FRUITS & VEGES", "JUICES"], "items": []},
+)
 
 # ---------- Products ----------
 @app.get("/api/products")
 def get_products():
-    ensure_file(
-        PRODUCTS_JSON,
-        {"title": "Trending Products", "categories": ["ALL", "FRUITS & VEGES", "JUICES"], "items": []},
-    )
-    data = read_json(PRODUCTS_JSON) or {}
-    resp = make_response(jsonify(data), 200)
-    resp.headers["Cache-Control"] = "no-store"
-    return resp
+    if any(k in request.args for k in FILTER_ARGS):
+        return filtered_response(products_store)
+    return store_response(products_store)
 
 @app.put("/api/products")
 def put_products():
@@ -51,22 +195,21 @@ def put_products():
         "categories": payload.get("categories") if isinstance(payload.get("categories"), list) and payload.get("categories") else ["ALL"],
         "items": payload.get("items") if isinstance(payload.get("items"), list) else [],
     }
-    write_json(PRODUCTS_JSON, normalized)
+    products_store.write(normalized)
     resp = make_response(jsonify({"ok": True}), 200)
     resp.headers["Cache-Control"] = "no-store"
     return resp
 
+@app.patch("/api/products/items/<item_id>")
+def patch_product_item(item_id):
+    return patch_item_response(products_store, item_id)
+
 # ---------- New Arrivals ----------
 @app.get("/api/new-arrivals")
 def get_new_arrivals():
-    ensure_file(
-        NEW_ARRIVALS_JSON,
-        {"title": "Newly Arrived", "categories": ["ALL", "FRUITS & VEGES", "JUICES"], "items": []},
-    )
-    data = read_json(NEW_ARRIVALS_JSON) or {}
-    resp = make_response(jsonify(data), 200)
-    resp.headers["Cache-Control"] = "no-store"
-    return resp
+    if any(k in request.args for k in FILTER_ARGS):
+        return filtered_response(new_arrivals_store)
+    return store_response(new_arrivals_store)
 
 @app.put("/api/new-arrivals")
 def put_new_arrivals():
@@ -76,11 +219,15 @@ def put_new_arrivals():
         "categories": payload.get("categories") if isinstance(payload.get("categories"), list) and payload.get("categories") else ["ALL"],
         "items": payload.get("items") if isinstance(payload.get("items"), list) else [],
     }
-    write_json(NEW_ARRIVALS_JSON, normalized)
+    new_arrivals_store.write(normalized)
     resp = make_response(jsonify({"ok": True}), 200)
     resp.headers["Cache-Control"] = "no-store"
     return resp
 
+@app.patch("/api/new-arrivals/items/<item_id>")
+def patch_new_arrival_item(item_id):
+    return patch_item_response(new_arrivals_store, item_id)
+
 # ---------- Upload + Serve ----------
 def is_allowed(filename: str, mimetype: str) -> bool:
     if not filename:
@@ -106,6 +253,13 @@ def upload_image():
 def serve_upload(filename):
     return send_from_directory(UPLOAD_DIR, filename, as_attachment=False)
 
+def bootstrap():
+    # create missing files and parse them once, before workers fork
+    for store in (products_store, new_arrivals_store):
+        store.snapshot()
+
 if __name__ == "__main__":
     # Flask on 3000; Vite proxy will point here
+    # production: WSGI_APP='wsgi:create_app("trending")' BIND=127.0.0.1:3000 gunicorn -c gunicorn.conf.py
+    bootstrap()
     app.run(host="127.0.0.1", port=3000, debug=True)
@@ -0,0 +1,22 @@
+# wsgi.py
+# Production entry point. The factory bootstraps once and returns the WSGI
+# app; with gunicorn.conf.py (preload_app) that happens in the master, before
+# workers fork.
+#
+#   gunicorn -c gunicorn.conf.py                                    # app.py, :5000
+#   WSGI_APP='wsgi:create_app("trending")' BIND=127.0.0.1:3000 \
+#       gunicorn -c gunicorn.conf.py                                # trending.py
+import os, sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+def create_app(name: str = "api"):
+    if name == "trending":
+        import trending
+        trending.bootstrap()
+        return trending.app
+    if name != "api":
+        raise ValueError(f"unknown app {name!r} (expected 'api' or 'trending')")
+    import app as api
+    api.bootstrap()
+    return api.app
@@ -55,7 +55,7 @@ function adapt(cards) {
 }
 
 async function fetchBestSelling() {
-  const res = await fetch(`/api/best-selling?ts=${Date.now()}`, { cache: "no-store" });
+  const res = await fetch("/api/best-selling", { cache: "no-cache" });
   if (!res.ok) throw new Error(`GET /api/best-selling ${res.status}`);
   const data = await res.json();
   const cards = Array.isArray(data?.cards) ? data.cards : [];
@@ -69,7 +69,7 @@ async function checkArrivedQty(id, units) {
 }
 
 async function fetchPopular() {
-  const res = await fetch(`/api/popular?ts=${Date.now()}`, { cache: "no-store" });
+  const res = await fetch("/api/popular", { cache: "no-cache" });
   if (!res.ok) throw new Error(`GET /api/popular ${res.status}`);
   const data = await res.json();
   const cards = Array.isArray(data?.cards) ? data.cards : [];
@@ -89,7 +89,7 @@ async function fetchPopular() {
 }
 
 async function fetchJustArrived() {
-  const res = await fetch(`/api/just-arrived?ts=${Date.now()}`, { cache: "no-store" });
+  const res = await fetch("/api/just-arrived", { cache: "no-cache" });
   if (!res.ok) throw new Error(`GET /api/just-arrived ${res.status}`);
   const data = await res.json();
   const cards = Array.isArray(data?.cards) ? data.cards : [];
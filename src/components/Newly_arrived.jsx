@@ -11,7 +11,7 @@ export default function NewlyArrived() {
 
   useEffect(() => {
     (async () => {
-      const res = await fetch(`/api/new-arrived?ts=${Date.now()}`, { cache: "no-store" });
+      const res = await fetch("/api/new-arrived", { cache: "no-cache" });
       const json = await res.json();
       setTitle(json.title || "Newly Arrived Brands");
       setItems((json.cards || []).filter((c) => c.visible !== false));
@@ -37,7 +37,7 @@ export default function Recent_blog() {
   const [loading, setLoading] = useState(true);
 
   async function loadBlogs() {
-    const res = await fetch(`/api/blogs?ts=${Date.now()}`, { cache: "no-store" });
+    const res = await fetch("/api/blogs", { cache: "no-cache" });
     if (!res.ok) throw new Error(`GET /api/blogs ${res.status}`);
     const data = await res.json();
     const list = Array.isArray(data?.cards) ? data.cards : [];
@@ -95,7 +95,7 @@ export default function Trending() {
       try {
         setLoading(true);
         setErr("");
-        const res = await fetch(`/api/trending?ts=${Date.now()}`, { cache: "no-store", signal });
+        const res = await fetch("/api/trending", { cache: "no-cache", signal });
         if (!res.ok) throw new Error(`GET /api/trending ${res.status}`);
         const data = await res.json();
         setTitle(String(data?.title || "Trending Products"));